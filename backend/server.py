@@ -8,7 +8,10 @@ import threading
 import time
 import httpx
 from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.background import BackgroundTask
 from contextlib import asynccontextmanager
 
 TS_BACKEND_URL = "http://127.0.0.1:8002"
@@ -69,14 +72,29 @@ def start_ts_backend():
 async def lifespan(app: FastAPI):
     # Startup
     threading.Thread(target=start_ts_backend, daemon=True).start()
+    # One shared client for all proxied requests: keep-alive connections to
+    # the TS backend are reused instead of paying a fresh TCP handshake (and
+    # client setup/teardown) per proxied call
+    app.state.client = httpx.AsyncClient(
+        base_url=TS_BACKEND_URL,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    )
     yield
     # Shutdown
+    await app.state.client.aclose()
     global ts_process
     if ts_process:
         ts_process.terminate()
 
 
-app = FastAPI(title="Fractal Backend Proxy", lifespan=lifespan)
+# orjson-backed serialization for the responses this app builds itself;
+# proxied /api/* bodies are passed through as raw bytes and never re-encoded
+app = FastAPI(title="Fractal Backend Proxy", lifespan=lifespan,
+              default_response_class=ORJSONResponse)
+
+# Compress the large sim/sweep JSON payloads (grids, event arrays) when the
+# client sends Accept-Encoding; small responses go out as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # CORS
 app.add_middleware(
@@ -100,44 +118,67 @@ async def proxy_api(request: Request, path: str):
     long_timeout_keywords = ["optimize", "sweep", "certify", "sim"]
     timeout = 900.0 if any(kw in path for kw in long_timeout_keywords) else 60.0
     
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        url = f"{TS_BACKEND_URL}/api/{path}"
-        
-        # Forward query params
-        if request.query_params:
-            url += f"?{request.query_params}"
-        
-        # Forward body for POST/PUT/PATCH
-        body = None
-        if request.method in ["POST", "PUT", "PATCH"]:
-            body = await request.body()
-        
-        try:
-            resp = await client.request(
-                method=request.method,
-                url=url,
-                content=body,
-                headers={
-                    k: v for k, v in request.headers.items()
-                    if k.lower() not in ["host", "content-length"]
-                },
-            )
-            
-            return Response(
-                content=resp.content,
+    url = f"/api/{path}"
+
+    # Forward query params
+    if request.query_params:
+        url += f"?{request.query_params}"
+
+    # Forward body for POST/PUT/PATCH
+    body = None
+    if request.method in ["POST", "PUT", "PATCH"]:
+        body = await request.body()
+
+    try:
+        req = app.state.client.build_request(
+            method=request.method,
+            url=url,
+            content=body,
+            headers={
+                k: v for k, v in request.headers.items()
+                if k.lower() not in ["host", "content-length"]
+            },
+            timeout=timeout,
+        )
+        resp = await app.state.client.send(req, stream=True)
+
+        # httpx decompresses the upstream body; drop its encoding headers so
+        # GZipMiddleware can negotiate compression with the client
+        headers = {
+            k: v for k, v in resp.headers.items()
+            if k.lower() not in ["content-encoding", "content-length"]
+        }
+        content_type = resp.headers.get("content-type", "")
+
+        if content_type.startswith("application/x-ndjson"):
+            # Pass NDJSON through chunk by chunk so sweep rows reach the
+            # client as the backend emits them; buffering here would hold
+            # every row until the whole sweep finished
+            return StreamingResponse(
+                resp.aiter_bytes(),
                 status_code=resp.status_code,
-                headers=dict(resp.headers),
-                media_type=resp.headers.get("content-type"),
-            )
-        except httpx.ConnectError:
-            return Response(
-                content='{"ok": false, "error": "TypeScript backend not ready"}',
-                status_code=503,
-                media_type="application/json",
-            )
-        except Exception as e:
-            return Response(
-                content=f'{{"ok": false, "error": "{str(e)}"}}',
-                status_code=500,
-                media_type="application/json",
+                headers=headers,
+                media_type=content_type,
+                background=BackgroundTask(resp.aclose),
             )
+
+        content = await resp.aread()
+        await resp.aclose()
+        return Response(
+            content=content,
+            status_code=resp.status_code,
+            headers=headers,
+            media_type=resp.headers.get("content-type"),
+        )
+    except httpx.ConnectError:
+        return Response(
+            content='{"ok": false, "error": "TypeScript backend not ready"}',
+            status_code=503,
+            media_type="application/json",
+        )
+    except Exception as e:
+        return Response(
+            content=f'{{"ok": false, "error": "{str(e)}"}}',
+            status_code=500,
+            media_type="application/json",
+        )
@@ -3,6 +3,7 @@
  * V1 + V2 endpoints
  */
 
+import { createHash } from 'crypto';
 import { FastifyInstance, FastifyRequest } from 'fastify';
 import { FractalEngine } from '../engine/fractal.engine.js';
 import { FractalBootstrapService } from '../bootstrap/fractal.bootstrap.service.js';
@@ -28,6 +29,11 @@ const bootstrap = new FractalBootstrapService();
 const modernProvider = new KrakenCsvProvider();
 const legacyProvider = new LegacyProvider();
 
+// Quick gate sweep runs a fixed grid over dates that only move at the UTC day
+// boundary, so the whole response (18 backtests) is memoized per day and
+// revalidated via ETag/If-None-Match instead of being recomputed per call
+let quickGateSweepCache: { day: string; etag: string; body: unknown } | null = null;
+
 function getYesterdayUTC(): Date {
   const now = new Date();
   const utcMidnight = Date.UTC(now.getUTCFullYear(), now.getUTCMonth(), now.getUTCDate());
@@ -3590,9 +3596,9 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
         stepDays: body.stepDays ?? 7,
         mode: body.mode ?? 'AUTOPILOT',
         experiment: body.experiment ?? 'E0',
-        attribution: true  // Enable DD attribution
+        attribution: body.attribution ?? true  // Full DD attribution on by default
       });
-      
+
       return {
         ok: result.ok,
         experiment: result.experiment,
@@ -3602,6 +3608,9 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
           cagr: Math.round(result.summary.cagr * 10000) / 10000,
           trades: result.summary.tradesOpened
         },
+        // Basic DD periods are always computed; fullDDAttribution is only
+        // present when attribution was requested
+        ddAttribution: result.ddAttribution,
         fullDDAttribution: result.fullDDAttribution,
         warnings: result.warnings,
         error: result.error
@@ -3673,14 +3682,14 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
    * POST /api/fractal/admin/sim/gate-sweep
    * Body: { from, to, enter: [0.25, 0.30, 0.35], full: [0.60, 0.65, 0.70], flip: [0.45, 0.55] }
    */
-  fastify.post('/api/fractal/admin/sim/gate-sweep', async (request) => {
+  fastify.post('/api/fractal/admin/sim/gate-sweep', async (request, reply) => {
     try {
       const { GateSweepService } = await import('../sim/sim.gate-sweep.service.js');
       const sweep = new GateSweepService();
-      
+
       const body = (request.body || {}) as any;
-      
-      const result = await sweep.gateSweep({
+
+      const sweepParams = {
         symbol: body.symbol ?? 'BTC',
         from: body.from ?? '2017-01-01',
         to: body.to ?? new Date().toISOString().slice(0, 10),
@@ -3690,11 +3699,35 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
         softGate: body.softGate ?? true,
         maxRuns: body.maxRuns ?? 30,
         mode: body.mode ?? 'AUTOPILOT'
-      });
-      
+      };
+
+      // NDJSON opt-in: one line per completed run while the grid is still
+      // computing, then a final {done: summary} line (result minus rows, which
+      // the client has already received). Cuts TTFB and peak response size.
+      if ((request.headers.accept ?? '').includes('application/x-ndjson')) {
+        reply.raw.writeHead(200, { 'content-type': 'application/x-ndjson' });
+        const result = await sweep.gateSweep({
+          ...sweepParams,
+          onRow: (row) => {
+            reply.raw.write(JSON.stringify({ row }) + '\n');
+          }
+        });
+        const { rows: _rows, ...summary } = result;
+        reply.raw.write(JSON.stringify({ done: summary }) + '\n');
+        reply.raw.end();
+        return reply;
+      }
+
+      const result = await sweep.gateSweep(sweepParams);
+
       return result;
     } catch (error) {
       const message = error instanceof Error ? error.message : 'Unknown error';
+      if (reply.raw.headersSent) {
+        reply.raw.write(JSON.stringify({ error: message }) + '\n');
+        reply.raw.end();
+        return reply;
+      }
       return { ok: false, error: message };
     }
   });
@@ -3703,21 +3736,42 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
    * Admin: Quick gate sweep (5 years, default grid)
    * GET /api/fractal/admin/sim/gate-sweep/quick
    */
-  fastify.get('/api/fractal/admin/sim/gate-sweep/quick', async () => {
+  fastify.get('/api/fractal/admin/sim/gate-sweep/quick', async (request, reply) => {
     try {
-      const { GateSweepService } = await import('../sim/sim.gate-sweep.service.js');
-      const sweep = new GateSweepService();
-      
-      const result = await sweep.quickGateSweep({});
-      
-      return {
-        ok: result.ok,
-        runs: result.runs,
-        duration: result.duration,
-        bestConfig: result.bestConfig,
-        baselineComparison: result.baselineComparison,
-        top10: result.top10
-      };
+      const day = new Date().toISOString().slice(0, 10);
+
+      if (!quickGateSweepCache || quickGateSweepCache.day !== day) {
+        const { GateSweepService } = await import('../sim/sim.gate-sweep.service.js');
+        const sweep = new GateSweepService();
+
+        const result = await sweep.quickGateSweep({});
+
+        const body = {
+          ok: result.ok,
+          symbol: result.symbol,
+          grid: result.grid,
+          runs: result.runs,
+          duration: result.duration,
+          bestConfig: result.bestConfig,
+          baselineComparison: result.baselineComparison,
+          top10: result.top10
+        };
+
+        // Failed sweeps are not cached so the next call retries
+        if (!result.ok) {
+          return body;
+        }
+
+        const etag = `"${createHash('sha1').update(JSON.stringify(body)).digest('hex')}"`;
+        quickGateSweepCache = { day, etag, body };
+      }
+
+      reply.header('ETag', quickGateSweepCache.etag);
+      if (request.headers['if-none-match'] === quickGateSweepCache.etag) {
+        reply.code(304);
+        return null;
+      }
+      return quickGateSweepCache.body;
     } catch (error) {
       const message = error instanceof Error ? error.message : 'Unknown error';
       return { ok: false, error: message };
@@ -3760,7 +3814,32 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
       const avgConfScale = confScaleEvents.length > 0
         ? confScaleEvents.reduce((a, e) => a + (e.meta?.scale ?? 1), 0) / confScaleEvents.length
         : 1;
-      
+
+      // The raw event stream dominates the payload; callers that only need
+      // counts/averages get the aggregates. ?fields=raw opts back into the
+      // row-per-event stream, ?fields=soa gets the same data as one array per
+      // column, which drops the per-row key repetition
+      const query = (request.query || {}) as any;
+      const includeEvents = query.fields === 'raw';
+      const includeSoA = query.fields === 'soa';
+
+      // Optional comma-separated ?types= filter trims the opt-in stream to
+      // just the event types the caller consumes
+      let rawEvents = events;
+      if ((includeEvents || includeSoA) && typeof query.types === 'string' && query.types.length > 0) {
+        const wanted = new Set(query.types.split(','));
+        rawEvents = events.filter(e => wanted.has(e.type));
+      }
+
+      const eventsSoA = includeSoA ? {
+        types: rawEvents.map(e => e.type),
+        ts: rawEvents.map(e => e.ts),
+        confidence: rawEvents.map(e => e.meta?.confidence ?? null),
+        scale: rawEvents.map(e => e.meta?.scale ?? null),
+        baseExposure: rawEvents.map(e => e.meta?.baseExposure ?? null),
+        finalExposure: rawEvents.map(e => e.meta?.finalExposure ?? null)
+      } : undefined;
+
       return {
         ok: result.ok,
         summary: {
@@ -3773,10 +3852,13 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
         gateTelemetry: {
           gateBlockEnter,
           gateBlockFlip,
+          confScaleCount: confScaleEvents.length,
           avgConfScale: Math.round(avgConfScale * 1000) / 1000,
           softKills: result.telemetry?.softKills ?? 0,
           hardKills: result.telemetry?.hardKills ?? 0
         },
+        ...(includeEvents ? { events: rawEvents } : {}),
+        ...(eventsSoA ? { eventsSoA } : {}),
         warnings: result.warnings,
         error: result.error
       };
@@ -3786,6 +3868,90 @@ export async function fractalRoutes(fastify: FastifyInstance): Promise<void> {
     }
   });
 
+  /**
+   * Admin: Run several gate configs over one shared base setup
+   * POST /api/fractal/admin/sim/gated/batch
+   * Body: { base: { symbol, from, to, stepDays, mode, experiment }, variants: [gateConfig | null, ...] }
+   *
+   * One request instead of one per config; the price/signal series is
+   * computed once via the shared lookup cache and each variant only
+   * re-applies its own gate thresholds.
+   */
+  fastify.post('/api/fractal/admin/sim/gated/batch', async (request) => {
+    try {
+      const { FractalSimulationRunner } = await import('../sim/sim.runner.js');
+      const sim = new FractalSimulationRunner();
+
+      const body = (request.body || {}) as any;
+      const base = body.base || {};
+      const variants: any[] = Array.isArray(body.variants) ? body.variants : [];
+
+      if (variants.length === 0) {
+        return { ok: false, error: 'variants must be a non-empty array of gate configs' };
+      }
+
+      const lookupCache = new Map<string, any>();
+      const results = [];
+
+      for (const variant of variants) {
+        const result = await sim.run({
+          symbol: base.symbol ?? 'BTC',
+          from: base.from ?? '2017-01-01',
+          to: base.to ?? new Date().toISOString().slice(0, 10),
+          stepDays: base.stepDays ?? 7,
+          mode: base.mode ?? 'AUTOPILOT',
+          experiment: base.experiment ?? 'E0',
+          gateConfig: variant ? {
+            enabled: variant.enabled ?? true,
+            minEnterConfidence: variant.minEnterConfidence ?? 0.35,
+            minFullSizeConfidence: variant.minFullSizeConfidence ?? 0.65,
+            minFlipConfidence: variant.minFlipConfidence ?? 0.45,
+            softGate: variant.softGate ?? true
+          } : undefined,
+          lookupCache
+        });
+
+        const events = result.events || [];
+        const gateBlockEnter = events.filter(e => e.type === 'GATE_BLOCK_ENTER').length;
+        const gateBlockFlip = events.filter(e => e.type === 'GATE_BLOCK_FLIP').length;
+        const confScales = events
+          .filter(e => e.type === 'CONF_SCALE')
+          .map(e => e.meta?.scale ?? 1);
+        const avgConfScale = confScales.length > 0
+          ? confScales.reduce((a, s) => a + s, 0) / confScales.length
+          : 1;
+
+        results.push({
+          ok: result.ok,
+          gateConfig: variant,
+          summary: {
+            sharpe: Math.round(result.summary.sharpe * 1000) / 1000,
+            maxDD: Math.round(result.summary.maxDD * 10000) / 10000,
+            cagr: Math.round(result.summary.cagr * 10000) / 10000,
+            trades: result.summary.tradesOpened,
+            finalEquity: Math.round(result.summary.finalEquity * 10000) / 10000
+          },
+          gateTelemetry: {
+            gateBlockEnter,
+            gateBlockFlip,
+            confScaleCount: confScales.length,
+            avgConfScale: Math.round(avgConfScale * 1000) / 1000,
+            softKills: result.telemetry?.softKills ?? 0,
+            hardKills: result.telemetry?.hardKills ?? 0
+          },
+          // Scales only, not full events: enough for per-variant gate checks
+          confScales,
+          error: result.error
+        });
+      }
+
+      return { ok: true, results };
+    } catch (error) {
+      const message = error instanceof Error ? error.message : 'Unknown error';
+      return { ok: false, error: message };
+    }
+  });
+
   // ═══════════════════════════════════════════════════════════════
   // BLOCK 34.5: GATE × RISK COMBO SWEEP
   // ═══════════════════════════════════════════════════════════════
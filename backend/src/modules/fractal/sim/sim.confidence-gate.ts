@@ -41,12 +41,17 @@ export function confidenceScale(conf: number, cfg: GateConfig): number {
   return Math.max(0, Math.min(1, t));
 }
 
+// Shared result for the disabled-gate fast path: called once per sim step,
+// so the no-op case should not allocate. Callers treat gate results as
+// read-only.
+const GATE_DISABLED_RESULT = { allowed: true, reason: 'GATE_DISABLED', scale: 1 };
+
 /**
  * Check if entry is allowed
  */
 export function canEnter(conf: number, cfg: GateConfig): { allowed: boolean; reason: string; scale: number } {
   if (!cfg.enabled) {
-    return { allowed: true, reason: 'GATE_DISABLED', scale: 1 };
+    return GATE_DISABLED_RESULT;
   }
 
   const c = conf ?? 0;
@@ -68,7 +73,7 @@ export function canEnter(conf: number, cfg: GateConfig): { allowed: boolean; rea
  */
 export function canFlip(conf: number, cfg: GateConfig): { allowed: boolean; reason: string; scale: number } {
   if (!cfg.enabled) {
-    return { allowed: true, reason: 'GATE_DISABLED', scale: 1 };
+    return GATE_DISABLED_RESULT;
   }
 
   const c = conf ?? 0;
@@ -35,6 +35,16 @@ export interface DDGroupStats {
   segments: number;
 }
 
+// Running per-group sums; the final DDGroupStats are derived from these so
+// grouping never materializes per-group segment arrays
+interface DDGroupAcc {
+  count: number;
+  sumDD: number;
+  maxDD: number;
+  sumConf: number;
+  sumHold: number;
+}
+
 export interface DDAttribution {
   totalSegments: number;
   peakDD: number;
@@ -122,13 +132,37 @@ export class DDAttributionEngine {
     const bySide = this.groupBy(s => s.side);
     const byConfidenceBucket = this.groupBy(s => this.confidenceBucket(s.confidence));
 
-    const peakDD = Math.max(...this.segments.map(s => s.dd));
-    const avgDD = this.segments.reduce((a, s) => a + s.dd, 0) / this.segments.length;
+    // One pass computes peak, sum and a bounded worst-10 selection; only the
+    // 10 retained segments are ever ordered, instead of copying and fully
+    // sorting the segment list (and Math.max(...spread) no longer risks
+    // blowing the argument limit on long sims)
+    const TOP_K = 10;
+    let peakDD = 0;
+    let sumDD = 0;
+    const worstSegments: DDSegment[] = [];
+    for (const s of this.segments) {
+      if (s.dd > peakDD) peakDD = s.dd;
+      sumDD += s.dd;
 
-    // Worst segments
-    const worstSegments = [...this.segments]
-      .sort((a, b) => b.dd - a.dd)
-      .slice(0, 10);
+      if (worstSegments.length < TOP_K) {
+        worstSegments.push(s);
+        if (worstSegments.length === TOP_K) {
+          worstSegments.sort((a, b) => b.dd - a.dd);
+        }
+      } else if (s.dd > worstSegments[TOP_K - 1].dd) {
+        // Shift the smaller entries down and drop the current minimum
+        let i = TOP_K - 1;
+        while (i > 0 && worstSegments[i - 1].dd < s.dd) {
+          worstSegments[i] = worstSegments[i - 1];
+          i--;
+        }
+        worstSegments[i] = s;
+      }
+    }
+    if (worstSegments.length < TOP_K) {
+      worstSegments.sort((a, b) => b.dd - a.dd);
+    }
+    const avgDD = sumDD / this.segments.length;
 
     // Dominant pattern analysis
     const dominantPattern = this.findDominantPattern(byYear, byRegime, byHorizon, bySide, byConfidenceBucket);
@@ -158,14 +192,22 @@ export class DDAttributionEngine {
   }
 
   /**
-   * Group segments by key
+   * Accumulate per-group stats in a single pass over the segments
    */
-  private groupBy(keyFn: (s: DDSegment) => string): Map<string, DDSegment[]> {
-    const map = new Map<string, DDSegment[]>();
+  private groupBy(keyFn: (s: DDSegment) => string): Map<string, DDGroupAcc> {
+    const map = new Map<string, DDGroupAcc>();
     for (const s of this.segments) {
       const key = keyFn(s);
-      if (!map.has(key)) map.set(key, []);
-      map.get(key)!.push(s);
+      let acc = map.get(key);
+      if (!acc) {
+        acc = { count: 0, sumDD: 0, maxDD: 0, sumConf: 0, sumHold: 0 };
+        map.set(key, acc);
+      }
+      acc.count++;
+      acc.sumDD += s.dd;
+      if (s.dd > acc.maxDD) acc.maxDD = s.dd;
+      acc.sumConf += s.confidence;
+      acc.sumHold += s.holdDays;
     }
     return map;
   }
@@ -183,22 +225,18 @@ export class DDAttributionEngine {
   /**
    * Compute stats for each group
    */
-  private mapStats(groups: Map<string, DDSegment[]>): Record<string, DDGroupStats> {
+  private mapStats(groups: Map<string, DDGroupAcc>): Record<string, DDGroupStats> {
     const result: Record<string, DDGroupStats> = {};
-    
-    for (const [key, segs] of groups.entries()) {
-      const dds = segs.map(s => s.dd);
-      const confs = segs.map(s => s.confidence);
-      const holds = segs.map(s => s.holdDays);
 
+    for (const [key, acc] of groups.entries()) {
       result[key] = {
-        count: segs.length,
-        avgDD: this.round(dds.reduce((a, b) => a + b, 0) / dds.length, 4),
-        maxDD: this.round(Math.max(...dds), 4),
-        totalDD: this.round(dds.reduce((a, b) => a + b, 0), 4),
-        avgConfidence: this.round(confs.reduce((a, b) => a + b, 0) / confs.length, 3),
-        avgHoldDays: this.round(holds.reduce((a, b) => a + b, 0) / holds.length, 1),
-        segments: segs.length
+        count: acc.count,
+        avgDD: this.round(acc.sumDD / acc.count, 4),
+        maxDD: this.round(acc.maxDD, 4),
+        totalDD: this.round(acc.sumDD, 4),
+        avgConfidence: this.round(acc.sumConf / acc.count, 3),
+        avgHoldDays: this.round(acc.sumHold / acc.count, 1),
+        segments: acc.count
       };
     }
 
@@ -209,18 +247,18 @@ export class DDAttributionEngine {
    * Find dominant pattern
    */
   private findDominantPattern(
-    byYear: Map<string, DDSegment[]>,
-    byRegime: Map<string, DDSegment[]>,
-    byHorizon: Map<string, DDSegment[]>,
-    bySide: Map<string, DDSegment[]>,
-    byConf: Map<string, DDSegment[]>
+    byYear: Map<string, DDGroupAcc>,
+    byRegime: Map<string, DDGroupAcc>,
+    byHorizon: Map<string, DDGroupAcc>,
+    bySide: Map<string, DDGroupAcc>,
+    byConf: Map<string, DDGroupAcc>
   ): DDAttribution['dominantPattern'] {
-    const findMax = (m: Map<string, DDSegment[]>) => {
+    const findMax = (m: Map<string, DDGroupAcc>) => {
       let maxKey: string | null = null;
       let maxCount = 0;
       for (const [k, v] of m.entries()) {
-        if (v.length > maxCount) {
-          maxCount = v.length;
+        if (v.count > maxCount) {
+          maxCount = v.count;
           maxKey = k;
         }
       }
@@ -255,53 +293,51 @@ export class DDAttributionEngine {
    * Generate actionable insights
    */
   private generateInsights(
-    byYear: Map<string, DDSegment[]>,
-    byRegime: Map<string, DDSegment[]>,
-    byVolatility: Map<string, DDSegment[]>,
-    byHorizon: Map<string, DDSegment[]>,
-    bySide: Map<string, DDSegment[]>,
-    byConf: Map<string, DDSegment[]>
+    byYear: Map<string, DDGroupAcc>,
+    byRegime: Map<string, DDGroupAcc>,
+    byVolatility: Map<string, DDGroupAcc>,
+    byHorizon: Map<string, DDGroupAcc>,
+    bySide: Map<string, DDGroupAcc>,
+    byConf: Map<string, DDGroupAcc>
   ): string[] {
     const insights: string[] = [];
     const total = this.segments.length;
     if (total === 0) return ['No significant DD segments detected'];
 
     // Year concentration
-    for (const [year, segs] of byYear.entries()) {
-      const pct = segs.length / total;
+    for (const [year, acc] of byYear.entries()) {
+      const pct = acc.count / total;
       if (pct > 0.5) {
-        const avgDD = segs.reduce((a, s) => a + s.dd, 0) / segs.length;
+        const avgDD = acc.sumDD / acc.count;
         insights.push(`🔴 ${Math.round(pct * 100)}% of DD concentrated in ${year} (avgDD: ${(avgDD * 100).toFixed(1)}%)`);
       }
     }
 
     // Regime concentration
-    for (const [regime, segs] of byRegime.entries()) {
-      const pct = segs.length / total;
+    for (const [regime, acc] of byRegime.entries()) {
+      const pct = acc.count / total;
       if (pct > 0.4) {
         insights.push(`⚠️ ${Math.round(pct * 100)}% of DD in ${regime} regime → Consider regime-specific risk`);
       }
     }
 
     // Volatility concentration
-    const highVolSegs = byVolatility.get('HIGH_VOL') ?? [];
-    if (highVolSegs.length / total > 0.5) {
-      insights.push(`⚠️ ${Math.round(highVolSegs.length / total * 100)}% DD in HIGH_VOL → Consider vol-based exposure scaling`);
+    const highVolCount = byVolatility.get('HIGH_VOL')?.count ?? 0;
+    if (highVolCount / total > 0.5) {
+      insights.push(`⚠️ ${Math.round(highVolCount / total * 100)}% DD in HIGH_VOL → Consider vol-based exposure scaling`);
     }
 
     // Horizon concentration
-    for (const [horizon, segs] of byHorizon.entries()) {
-      const pct = segs.length / total;
+    for (const [horizon, acc] of byHorizon.entries()) {
+      const pct = acc.count / total;
       if (pct > 0.5) {
         insights.push(`⚠️ ${Math.round(pct * 100)}% DD at horizon ${horizon} → Consider horizon hysteresis`);
       }
     }
 
     // Side asymmetry
-    const longSegs = bySide.get('LONG') ?? [];
-    const shortSegs = bySide.get('SHORT') ?? [];
-    const longPct = longSegs.length / total;
-    const shortPct = shortSegs.length / total;
+    const longPct = (bySide.get('LONG')?.count ?? 0) / total;
+    const shortPct = (bySide.get('SHORT')?.count ?? 0) / total;
     if (longPct > 0.7) {
       insights.push(`⚠️ ${Math.round(longPct * 100)}% DD on LONG side → Consider asymmetric risk for longs`);
     } else if (shortPct > 0.7) {
@@ -309,8 +345,9 @@ export class DDAttributionEngine {
     }
 
     // Confidence analysis
-    const lowConfSegs = [...(byConf.get('LOW (20-50%)') ?? []), ...(byConf.get('VERY_LOW (<20%)') ?? [])];
-    const lowConfPct = lowConfSegs.length / total;
+    const lowConfCount = (byConf.get('LOW (20-50%)')?.count ?? 0)
+      + (byConf.get('VERY_LOW (<20%)')?.count ?? 0);
+    const lowConfPct = lowConfCount / total;
     if (lowConfPct > 0.5) {
       insights.push(`🔴 ${Math.round(lowConfPct * 100)}% DD from LOW confidence entries → Need confidence gating`);
     }
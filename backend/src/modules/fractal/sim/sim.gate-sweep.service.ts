@@ -75,6 +75,9 @@ export class GateSweepService {
     softGate?: boolean;
     maxRuns?: number;
     mode?: 'AUTOPILOT' | 'FROZEN';
+    // Invoked as each combo completes, so callers can stream rows while the
+    // remainder of the grid is still computing
+    onRow?: (row: GateSweepRow) => void;
   }): Promise<GateSweepResult> {
     const startTime = Date.now();
     const maxRuns = params.maxRuns ?? 50;
@@ -83,6 +86,11 @@ export class GateSweepService {
     const rows: GateSweepRow[] = [];
     let runs = 0;
 
+    // Every combo replays the same symbol/date range with identical settings;
+    // share one lookup cache so the price/signal series is computed once and
+    // each run only re-evaluates its thresholds against it
+    const lookupCache = new Map<string, any>();
+
     // Run baseline first (no gating)
     console.log('[GateSweep] Running baseline (no gating)...');
     const baselineResult = await this.sim.run({
@@ -92,7 +100,8 @@ export class GateSweepService {
       stepDays: 7,
       mode: params.mode ?? 'AUTOPILOT',
       experiment: 'E0',
-      gateConfig: { enabled: false } as any
+      gateConfig: { enabled: false } as any,
+      lookupCache
     });
 
     const baseline = {
@@ -106,6 +115,12 @@ export class GateSweepService {
     // Grid sweep
     console.log(`[GateSweep] Starting grid: ${params.enter.length}×${params.full.length}×${params.flip.length} = ${params.enter.length * params.full.length * params.flip.length} combinations`);
 
+    // Flatten the grid up front (sanity filters and maxRuns applied here),
+    // then evaluate combos on a small concurrent pool: the sim math shares
+    // the cached series, while each run's remaining Mongo lookups overlap
+    // across combos instead of serializing
+    const combos: Array<{ minEnter: number; minFull: number; minFlip: number }> = [];
+    outer:
     for (const minEnter of params.enter) {
       for (const minFull of params.full) {
         // Sanity: minFull should be > minEnter
@@ -114,77 +129,92 @@ export class GateSweepService {
         for (const minFlip of params.flip) {
           // Sanity: minFlip should be >= minEnter
           if (minFlip < minEnter) continue;
+          if (combos.length >= maxRuns) break outer;
+          combos.push({ minEnter, minFull, minFlip });
+        }
+      }
+    }
+
+    const CONCURRENCY = 4;
+    let nextCombo = 0;
+
+    const worker = async () => {
+      while (nextCombo < combos.length) {
+        const comboIdx = nextCombo++;
+        const { minEnter, minFull, minFlip } = combos[comboIdx];
+
+        const gateConfig: GateConfig = {
+          enabled: true,
+          minEnterConfidence: minEnter,
+          minFullSizeConfidence: minFull,
+          minFlipConfidence: minFlip,
+          softGate
+        };
 
-          if (runs >= maxRuns) break;
+        console.log(`[GateSweep] Run ${comboIdx + 1}/${combos.length}: ${formatGateConfig(gateConfig)}`);
 
-          const gateConfig: GateConfig = {
-            enabled: true,
-            minEnterConfidence: minEnter,
-            minFullSizeConfidence: minFull,
-            minFlipConfidence: minFlip,
-            softGate
+        try {
+          const result = await this.sim.run({
+            symbol: params.symbol,
+            from: params.from,
+            to: params.to,
+            stepDays: 7,
+            mode: params.mode ?? 'AUTOPILOT',
+            experiment: 'E0',
+            gateConfig,
+            lookupCache
+          });
+
+          // Extract gate telemetry
+          const events = result.events || [];
+          const gateBlockEnter = events.filter(e => e.type === 'GATE_BLOCK_ENTER').length;
+          const gateBlockFlip = events.filter(e => e.type === 'GATE_BLOCK_FLIP').length;
+          const confScaleEvents = events.filter(e => e.type === 'CONF_SCALE');
+          const avgConfScale = confScaleEvents.length > 0
+            ? confScaleEvents.reduce((a, e) => a + (e.meta?.scale ?? 1), 0) / confScaleEvents.length
+            : 1;
+
+          // Composite score
+          const trades = result.summary.tradesOpened;
+          const sharpe = result.summary.sharpe;
+          const maxDD = result.summary.maxDD;
+          const softKills = result.telemetry?.softKills ?? 0;
+
+          // Score = sharpe - 0.5*maxDD - 0.1*(softKills/trades)
+          const softKillPenalty = trades > 0 ? 0.1 * (softKills / trades) : 0;
+          const score = sharpe - 0.5 * maxDD - softKillPenalty;
+
+          const row: GateSweepRow = {
+            minEnter,
+            minFull,
+            minFlip,
+            softGate,
+            sharpe: this.round(sharpe, 4),
+            maxDD: this.round(maxDD, 4),
+            cagr: this.round(result.summary.cagr, 4),
+            trades,
+            gateBlockEnter,
+            gateBlockFlip,
+            avgConfScale: this.round(avgConfScale, 3),
+            avgPosSize: this.round(result.summary.turnover / Math.max(1, trades), 3),
+            softKills,
+            hardKills: result.telemetry?.hardKills ?? 0,
+            score: this.round(score, 4),
+            finalEquity: this.round(result.summary.finalEquity, 4)
           };
+          rows.push(row);
+          params.onRow?.(row);
 
-          console.log(`[GateSweep] Run ${runs + 1}/${maxRuns}: ${formatGateConfig(gateConfig)}`);
-
-          try {
-            const result = await this.sim.run({
-              symbol: params.symbol,
-              from: params.from,
-              to: params.to,
-              stepDays: 7,
-              mode: params.mode ?? 'AUTOPILOT',
-              experiment: 'E0',
-              gateConfig
-            });
-
-            // Extract gate telemetry
-            const events = result.events || [];
-            const gateBlockEnter = events.filter(e => e.type === 'GATE_BLOCK_ENTER').length;
-            const gateBlockFlip = events.filter(e => e.type === 'GATE_BLOCK_FLIP').length;
-            const confScaleEvents = events.filter(e => e.type === 'CONF_SCALE');
-            const avgConfScale = confScaleEvents.length > 0
-              ? confScaleEvents.reduce((a, e) => a + (e.meta?.scale ?? 1), 0) / confScaleEvents.length
-              : 1;
-
-            // Composite score
-            const trades = result.summary.tradesOpened;
-            const sharpe = result.summary.sharpe;
-            const maxDD = result.summary.maxDD;
-            const softKills = result.telemetry?.softKills ?? 0;
-
-            // Score = sharpe - 0.5*maxDD - 0.1*(softKills/trades)
-            const softKillPenalty = trades > 0 ? 0.1 * (softKills / trades) : 0;
-            const score = sharpe - 0.5 * maxDD - softKillPenalty;
-
-            rows.push({
-              minEnter,
-              minFull,
-              minFlip,
-              softGate,
-              sharpe: this.round(sharpe, 4),
-              maxDD: this.round(maxDD, 4),
-              cagr: this.round(result.summary.cagr, 4),
-              trades,
-              gateBlockEnter,
-              gateBlockFlip,
-              avgConfScale: this.round(avgConfScale, 3),
-              avgPosSize: this.round(result.summary.turnover / Math.max(1, trades), 3),
-              softKills,
-              hardKills: result.telemetry?.hardKills ?? 0,
-              score: this.round(score, 4),
-              finalEquity: this.round(result.summary.finalEquity, 4)
-            });
-
-            runs++;
-          } catch (err) {
-            console.error(`[GateSweep] Error:`, err);
-          }
+          runs++;
+        } catch (err) {
+          console.error(`[GateSweep] Error:`, err);
         }
-        if (runs >= maxRuns) break;
       }
-      if (runs >= maxRuns) break;
-    }
+    };
+
+    await Promise.all(
+      Array.from({ length: Math.min(CONCURRENCY, combos.length) }, () => worker())
+    );
 
     // Sort by: 1) trades >= 10, 2) maxDD < 0.30, 3) score desc
     rows.sort((a, b) => {
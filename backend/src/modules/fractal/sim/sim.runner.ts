@@ -12,7 +12,7 @@ import { SimTelemetry, SimEventType } from './sim.telemetry.js';
 import { SimExperiment, getExperimentOverrides, getExperimentDescription, ExperimentOverrides } from './sim.experiments.js';
 import { SimOverrides, applyOverrides } from './sim.overrides.js';
 import { DDAttributionEngine, DDAttribution } from './sim.dd-attribution.js';
-import { GateConfig, DEFAULT_GATE_CONFIG, canEnter, canFlip, confidenceScale } from './sim.confidence-gate.js';
+import { GateConfig, DEFAULT_GATE_CONFIG, canEnter, canFlip } from './sim.confidence-gate.js';
 import { FractalSettingsModel } from '../data/schemas/fractal-settings.schema.js';
 import { FractalRiskStateModel } from '../data/schemas/fractal-risk-state.schema.js';
 import { FractalAutopilotRunModel } from '../data/schemas/fractal-autopilot-run.schema.js';
@@ -37,6 +37,10 @@ export interface SimConfig {
   overrides?: SimOverrides;  // BLOCK 34.2: Direct parameter overrides
   attribution?: boolean;     // BLOCK 34.3: Enable DD attribution
   gateConfig?: GateConfig;   // BLOCK 34.4: Confidence gating
+  // Shared per-step price/signal lookups for sweeps that replay the same
+  // symbol/date range under different configs. Only valid across runs with
+  // identical symbol and settings overrides - the caller owns that invariant.
+  lookupCache?: Map<string, any>;
 }
 
 export interface SimEquityPoint {
@@ -117,6 +121,63 @@ export interface SimResult {
   error?: string;
 }
 
+// Full daily candle history per symbol, loaded once per UTC day per process.
+// Steps and signal windows slice it by binary search instead of issuing one
+// Mongo query per step; daily candles stay small enough to hold in memory.
+interface CandleSeries {
+  ts: number[];
+  closes: (number | null)[];
+}
+
+const seriesCache = new Map<string, { day: string; series: Promise<CandleSeries> }>();
+
+function loadSeries(symbol: string): Promise<CandleSeries> {
+  const day = new Date().toISOString().slice(0, 10);
+  const cached = seriesCache.get(symbol);
+  if (cached && cached.day === day) {
+    return cached.series;
+  }
+
+  const series = CanonicalOhlcvModel.find({ 'meta.symbol': symbol })
+    .sort({ ts: 1 }).lean()
+    .then((docs: any[]) => ({
+      ts: docs.map(d => new Date(d.ts).getTime()),
+      closes: docs.map(d => d.ohlcv?.c ?? null)
+    }));
+  // The promise is cached before it settles so concurrent runs share one
+  // query; if it rejects, evict it so the next run retries instead of
+  // replaying a transient Mongo failure for the rest of the day
+  series.catch(() => {
+    if (seriesCache.get(symbol)?.series === series) seriesCache.delete(symbol);
+  });
+  seriesCache.set(symbol, { day, series });
+  return series;
+}
+
+// Confidence/scale telemetry only carries 2-3 meaningful digits (consumers
+// round to 3); quantizing at the log sites keeps full precision in the sim
+// math while cutting the digit-printing cost and payload bytes per event
+function round3(n: number): number {
+  return Math.round(n * 1000) / 1000;
+}
+
+/** Index of the last timestamp <= t, or -1 when t precedes the series */
+function lastIndexAtOrBefore(ts: number[], t: number): number {
+  let lo = 0;
+  let hi = ts.length - 1;
+  let ans = -1;
+  while (lo <= hi) {
+    const mid = (lo + hi) >> 1;
+    if (ts[mid] <= t) {
+      ans = mid;
+      lo = mid + 1;
+    } else {
+      hi = mid - 1;
+    }
+  }
+  return ans;
+}
+
 export class FractalSimulationRunner {
   async run(config: SimConfig): Promise<SimResult> {
     const {
@@ -211,18 +272,17 @@ export class FractalSimulationRunner {
     let stepCount = 0;
     let tradePnl = 0;
 
+    // One series load per symbol per process; every step slices it in memory
+    const series = await loadSeries(symbol);
+
     try {
       while (clock.now() <= end) {
         const asOf = clock.now();
         stepCount++;
 
-        // Get price at asOf
-        const priceDoc = await CanonicalOhlcvModel.findOne({
-          'meta.symbol': symbol,
-          ts: { $lte: asOf }
-        }).sort({ ts: -1 }).lean() as any;
-
-        const price = priceDoc?.ohlcv?.c ?? lastPrice;
+        // Get price at asOf: binary search into the in-memory series
+        const priceIdx = lastIndexAtOrBefore(series.ts, asOf.getTime());
+        const price = (priceIdx >= 0 ? series.closes[priceIdx] : null) ?? lastPrice;
         if (!price) {
           clock.addDays(stepDays);
           continue;
@@ -247,8 +307,15 @@ export class FractalSimulationRunner {
         // Calculate current DD
         const currentDD = peakEquity > 0 ? (peakEquity - equity) / peakEquity : 0;
 
-        // Get signal (simplified - use rule-based from canonical data)
-        const signal = await this.getSignalAtDate(symbol, asOf, settings, currentHorizon);
+        // Get signal (simplified - use rule-based from canonical data).
+        // Deterministic for (asOf, horizon) under fixed settings, so sweep
+        // combos share the computed value through the lookup cache.
+        const signalKey = `sig:${asOf.getTime()}:${currentHorizon}`;
+        let signal = config.lookupCache?.get(signalKey);
+        if (signal === undefined) {
+          signal = await this.getSignalAtDate(symbol, asOf, settings, currentHorizon);
+          config.lookupCache?.set(signalKey, signal);
+        }
         currentConfidence = signal.confidence;
         
         // Track regime changes
@@ -347,7 +414,7 @@ export class FractalSimulationRunner {
         // Normal exit
         else if (position !== 'FLAT' && holdDays >= minHold) {
           if (signal.direction === 'NEUTRAL' || signal.confidence < exitThr) {
-            telemetry.log('EXIT', asOf, { reason: 'SIGNAL_WEAK', confidence: signal.confidence });
+            telemetry.log('EXIT', asOf, { reason: 'SIGNAL_WEAK', confidence: round3(signal.confidence) });
             const exitCost = roundTripCost / 2 * posSize;
             equity *= (1 - exitCost);
             totalCosts += exitCost;
@@ -370,39 +437,44 @@ export class FractalSimulationRunner {
             
             if (!enterCheck.allowed) {
               // Gate blocked entry
-              telemetry.log('GATE_BLOCK_ENTER' as SimEventType, asOf, { 
-                confidence: signal.confidence, 
+              telemetry.log('GATE_BLOCK_ENTER' as SimEventType, asOf, {
+                confidence: round3(signal.confidence),
                 minRequired: gateConfig.minEnterConfidence,
-                reason: enterCheck.reason 
+                reason: enterCheck.reason
               });
               gateBlockEnterCount++;
               action = 'GATE_BLOCK_ENTER';
             } else {
-              // Gate passed - calculate scaled exposure
-              const confScale = confidenceScale(signal.confidence, gateConfig);
+              // Gate passed - canEnter already computed the scale
+              const confScale = enterCheck.scale;
               const baseExposure = Math.min(2, Math.max(0, signal.confidence * 2));
               const exposure = baseExposure * confScale;
               
-              // Track confidence scaling
-              telemetry.log('CONF_SCALE' as SimEventType, asOf, { 
-                confidence: signal.confidence, 
-                scale: confScale, 
-                baseExposure, 
-                finalExposure: exposure 
-              });
-              totalConfScaleSum += confScale;
-              confScaleCount++;
+              // Track confidence scaling - only when the gate is actually on.
+              // A disabled gate passes every entry with scale=1, and logging
+              // that as CONF_SCALE would report gating activity for runs that
+              // have gating switched off
+              if (gateConfig.enabled) {
+                telemetry.log('CONF_SCALE' as SimEventType, asOf, {
+                  confidence: round3(signal.confidence),
+                  scale: round3(confScale),
+                  baseExposure: round3(baseExposure),
+                  finalExposure: round3(exposure)
+                });
+                totalConfScaleSum += confScale;
+                confScaleCount++;
+              }
 
               if (exposure > 0.01) { // Minimum exposure threshold
                 const entryCost = roundTripCost / 2 * exposure;
                 equity *= (1 - entryCost);
                 totalCosts += entryCost;
                 
-                telemetry.log('ENTER', asOf, { 
-                  side: signal.direction, 
-                  confidence: signal.confidence,
-                  confScale,
-                  exposure,
+                telemetry.log('ENTER', asOf, {
+                  side: signal.direction,
+                  confidence: round3(signal.confidence),
+                  confScale: round3(confScale),
+                  exposure: round3(exposure),
                   regime: regimeKey
                 });
                 
@@ -626,18 +698,19 @@ export class FractalSimulationRunner {
     horizon: number;
     regime?: { trend: string; volatility: string };
   }> {
-    // Get last 90 days of prices
-    const prices = await CanonicalOhlcvModel.find({
-      'meta.symbol': symbol,
-      ts: { $lte: asOf }
-    }).sort({ ts: -1 }).limit(90).lean() as any[];
+    // Last 90 days of closes, sliced from the in-memory series instead of a
+    // per-step Mongo query
+    const series = await loadSeries(symbol);
+    const endIdx = lastIndexAtOrBefore(series.ts, asOf.getTime());
 
-    if (prices.length < 60) {
+    if (endIdx + 1 < 60) {
       return { direction: 'NEUTRAL', confidence: 0, horizon };
     }
 
-    const closes = prices.map(p => p.ohlcv?.c ?? 0).reverse();
-    
+    const closes = series.closes
+      .slice(Math.max(0, endIdx - 89), endIdx + 1)
+      .map(c => c ?? 0);
+
     // Simple momentum signal
     const recent = closes.slice(-Math.min(horizon, 30));
     const older = closes.slice(-60, -30);